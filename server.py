@@ -1,42 +1,83 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+import atexit
 import logging
-from app import router
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-
-# Create FastAPI app
-app = FastAPI(
-    title="AI Chat Widget API",
-    description="Streaming AI chat API for website integration",
-    version="1.0.0"
-)
-
-# Add CORS middleware for cross-origin requests (essential for widget embedding)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins for widget embedding
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include the chat router
-app.include_router(router)
-
-# Root endpoint
-@app.get("/")
-async def root():
-    return {
-        "message": "AI Chat Widget API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "health": "/health"
-    }
+import logging.handlers
+import queue
+
+
+def configure_logging() -> None:
+    """
+    Send root logging through a queue written by a background listener thread,
+    so request handlers and the crawler's event loop never block on stderr.
+
+    Safe to call more than once: this module can run twice in one process
+    (as __main__ and again when uvicorn imports "server:app"), and a second
+    handler would print every record twice.
+    """
+    root_logger = logging.getLogger()
+    if any(
+        isinstance(handler, logging.handlers.QueueHandler)
+        for handler in root_logger.handlers
+    ):
+        return
+
+    log_queue = queue.SimpleQueue()
+    log_handler = logging.StreamHandler()
+    log_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+    log_listener = logging.handlers.QueueListener(log_queue, log_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+def create_app() -> FastAPI:
+    """Build the FastAPI app with CORS and the chat routes."""
+    # Imported here: it pulls in the agent stack (agno, OpenAI, Exa, MongoDB storage)
+    from app import router
+
+    # Create FastAPI app
+    app = FastAPI(
+        title="AI Chat Widget API",
+        description="Streaming AI chat API for website integration",
+        version="1.0.0"
+    )
+
+    # Add CORS middleware for cross-origin requests (essential for widget embedding)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # Allow all origins for widget embedding
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Include the chat router
+    app.include_router(router)
+
+    # Root endpoint
+    @app.get("/")
+    async def root():
+        return {
+            "message": "AI Chat Widget API",
+            "version": "1.0.0",
+            "docs": "/docs",
+            "health": "/health"
+        }
+
+    return app
+
+
+# multiprocessing "spawn" children (uvicorn's reload worker, tool.py's sitemap parse
+# pool) re-run this file as __mp_main__. They never serve requests from it, so they
+# skip building the app and starting another log listener.
+if __name__ != "__mp_main__":
+    configure_logging()
+    app = create_app()
 
 if __name__ == "__main__":
     import uvicorn
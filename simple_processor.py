@@ -5,11 +5,17 @@ Minimal processor to test streaming works
 
 import json
 import logging
+import re
 from typing import AsyncGenerator, Dict, Any
 from agno.run.response import RunResponse, RunEvent
 
 logger = logging.getLogger(__name__)
 
+# Exa result patterns, compiled once instead of on every completed run
+_EXA_JSON_ARRAY_RE = re.compile(r'\[\s*{[^}]*"url"[^}]*}[^]]*\]', re.DOTALL)
+_EXA_URL_RE = re.compile(r'"url":\s*"([^"]+)"')
+_EXA_TITLE_RE = re.compile(r'"title":\s*"([^"]+)"')
+
 
 async def simple_process_stream(
     raw_stream: AsyncGenerator,
@@ -209,12 +215,10 @@ async def simple_process_stream(
                     # Look for Exa search results in content buffer - more robust JSON extraction
                     if content_buffer and ('"url":' in content_buffer or "'url':" in content_buffer):
                         # Try multiple patterns to find JSON arrays with URL objects
-                        import re
                         import json as json_lib
                         
                         # Pattern 1: Complete JSON array
-                        json_pattern = r'\[\s*{[^}]*"url"[^}]*}[^]]*\]'
-                        json_matches = re.findall(json_pattern, content_buffer, re.DOTALL)
+                        json_matches = _EXA_JSON_ARRAY_RE.findall(content_buffer)
                         
                         for json_str in json_matches:
                             try:
@@ -237,10 +241,8 @@ async def simple_process_stream(
                         
                         # Pattern 2: Individual URL extraction as fallback
                         if not json_matches:
-                            url_pattern = r'"url":\s*"([^"]+)"'
-                            url_matches = re.findall(url_pattern, content_buffer)
-                            title_pattern = r'"title":\s*"([^"]+)"'
-                            title_matches = re.findall(title_pattern, content_buffer)
+                            url_matches = _EXA_URL_RE.findall(content_buffer)
+                            title_matches = _EXA_TITLE_RE.findall(content_buffer)
                             
                             for i, url in enumerate(url_matches):
                                 from urllib.parse import urlparse
@@ -288,7 +290,7 @@ async def simple_process_stream(
                     'type': 'completion',
                     'final_content': content_buffer,
                     'sources': unique_sources,
-                    'crawled_urls': list(set(crawled_urls))  # Remove duplicates from crawled_urls too
+                    'crawled_urls': list(dict.fromkeys(crawled_urls))  # Remove duplicates, keeping first-seen order
                 })}\n\n"
 
             # 🚨 ERROR HANDLING
@@ -0,0 +1,98 @@
+"""
+Sitemap XML parsing, kept free of heavy imports.
+
+Large sitemaps are parsed in spawned worker processes (see tool._get_parse_pool).
+Each worker imports this module to unpickle the parse function, so it only pulls
+in lxml and the standard library, not agno or aiohttp.
+"""
+
+import functools
+import io
+import logging
+from typing import List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=2048)
+def _is_host_allowed(host: str, allowed_suffixes: Tuple[str, ...]) -> bool:
+    """Check a lowercased netloc against the allow-list, memoized since batches share hosts."""
+    # endswith() covers the usual exact/subdomain match in a single C call;
+    # the substring scan keeps the looser legacy match (e.g. hosts with ports)
+    return host.endswith(allowed_suffixes) or any(
+        allowed_domain in host for allowed_domain in allowed_suffixes
+    )
+
+
+def is_url_allowed(url: str, allowed_suffixes: Optional[Tuple[str, ...]]) -> bool:
+    """Check if URL's host is within a lowercased allow-list; None allows every host."""
+    if not allowed_suffixes:
+        return True
+
+    try:
+        host = urlsplit(url).netloc.lower()
+    except ValueError:  # e.g. malformed IPv6 host
+        return False
+    return _is_host_allowed(host, allowed_suffixes)
+
+
+def _fast_join(base_url: str, href: str) -> str:
+    """urljoin, short-circuited for the common case of an already absolute http(s) URL."""
+    href = href.strip()
+    if href.startswith(("http://", "https://")):
+        return href
+    return urljoin(base_url, href)
+
+
+def parse_sitemap_xml(
+    xml_content: bytes,
+    base_url: str,
+    allowed_suffixes: Optional[Tuple[str, ...]],
+) -> Tuple[List[str], List[str]]:
+    """
+    Parse a sitemap / sitemap index into (page_urls, sitemap_urls).
+
+    Module-level and free of instance state so it can run in the parse pool.
+    The document is streamed with iterparse and every processed element is
+    discarded, so memory stays flat even for 50k-URL sitemaps.
+    """
+    page_urls = []
+    sitemap_urls = []
+
+    try:
+        context = etree.iterparse(
+            io.BytesIO(xml_content),
+            events=("end",),
+            tag=("{*}url", "{*}sitemap"),
+            huge_tree=True,
+            recover=True,
+            resolve_entities=False,
+        )
+        for _, elem in context:
+            loc = elem.find("{*}loc")
+            if loc is not None and loc.text:
+                full_url = _fast_join(base_url, loc.text)
+                if is_url_allowed(full_url, allowed_suffixes):
+                    # <url> is a regular sitemap entry, <sitemap> an index entry
+                    if etree.QName(elem).localname == "url":
+                        page_urls.append(full_url)
+                    else:
+                        sitemap_urls.append(full_url)
+
+            # Free the element and any already-processed siblings
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    except etree.XMLSyntaxError as e:
+        logger.debug("❌ XML parsing error: %s", e)
+
+    logger.debug(
+        "📋 Parsed XML: %d page URLs, %d nested sitemaps",
+        len(page_urls),
+        len(sitemap_urls),
+    )
+    return page_urls, sitemap_urls
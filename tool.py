@@ -1,53 +1,507 @@
 import asyncio
+import atexit
+import concurrent.futures
+import concurrent.futures.process
+import contextlib
+import functools
+import gc
+import io
+import logging
+import multiprocessing
 import re
-import xml.etree.ElementTree as ET
-from typing import List, Tuple, Dict, Optional
-from urllib.parse import urljoin, urlparse
+import threading
+from collections import OrderedDict
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlsplit
 from agno.tools import Toolkit
 import aiohttp
+from sitemap_parser import is_url_allowed, parse_sitemap_xml
 import time
 import os
+import zlib
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+# Jina Reader results cached by (url, options). Kept at module level because a new
+# WebCrawlerTool is created for every chat request.
+JINA_CACHE_TTL = 24 * 60 * 60  # seconds before a cached read is revalidated
+JINA_CACHE_MAXSIZE = 512
+# Size caps, measured as len(content); Jina returns mostly-ASCII markdown, so this
+# tracks the UTF-8 size closely. Reads above the per-entry cap are never cached.
+JINA_CACHE_MAX_BYTES = 64 * 1024 * 1024
+JINA_CACHE_MAX_ENTRY_BYTES = 4 * 1024 * 1024
+_jina_cache: "OrderedDict[Tuple, Tuple[float, Optional[str], str]]" = OrderedDict()
+_jina_cache_bytes = 0
+_jina_cache_lock = threading.Lock()
+
+
+def _jina_cache_get(key: Tuple) -> Optional[Tuple[float, Optional[str], str]]:
+    """Return (stored_at, etag, content) for a cached read, or None."""
+    with _jina_cache_lock:
+        entry = _jina_cache.get(key)
+        if entry is not None:
+            _jina_cache.move_to_end(key)
+        return entry
+
+
+def _jina_cache_put(key: Tuple, etag: Optional[str], content: str) -> None:
+    """Store a successful read, evicting least recently used entries when over budget."""
+    global _jina_cache_bytes
+    with _jina_cache_lock:
+        old = _jina_cache.pop(key, None)
+        if old is not None:
+            _jina_cache_bytes -= len(old[2])
+        if len(content) > JINA_CACHE_MAX_ENTRY_BYTES:
+            return
+        _jina_cache[key] = (time.time(), etag, content)
+        _jina_cache_bytes += len(content)
+        while (
+            len(_jina_cache) > JINA_CACHE_MAXSIZE
+            or _jina_cache_bytes > JINA_CACHE_MAX_BYTES
+        ):
+            _, evicted = _jina_cache.popitem(last=False)
+            _jina_cache_bytes -= len(evicted[2])
+
+
+# Validators (ETag / Last-Modified) and body from the last 200 response for each
+# sitemap / llms.txt URL, so rediscovery can send a conditional GET and reuse the
+# body on 304 Not Modified.
+CONDITIONAL_CACHE_MAXSIZE = 256
+# Total / per-body size caps (len of the body); larger bodies are simply refetched
+CONDITIONAL_CACHE_MAX_BYTES = 32 * 1024 * 1024
+CONDITIONAL_CACHE_MAX_ENTRY_BYTES = 8 * 1024 * 1024
+# (etag, last_modified, body); sitemap bodies are raw bytes, llms.txt is text
+_ConditionalEntry = Tuple[Optional[str], Optional[str], Union[str, bytes]]
+_conditional_cache: "OrderedDict[str, _ConditionalEntry]" = OrderedDict()
+_conditional_cache_bytes = 0
+_conditional_cache_lock = threading.Lock()
+
+
+def _conditional_request(
+    url: str,
+) -> Tuple[Dict[str, str], Optional[_ConditionalEntry]]:
+    """Return (request headers, cached entry) for a conditional GET of url."""
+    with _conditional_cache_lock:
+        entry = _conditional_cache.get(url)
+        if entry is not None:
+            _conditional_cache.move_to_end(url)
+
+    headers = {}
+    if entry is not None:
+        etag, last_modified, _ = entry
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    return headers, entry
+
+
+def _conditional_cache_put(
+    url: str, response_headers, body: Union[str, bytes]
+) -> None:
+    """Remember a 200 response body if the server sent validators for it."""
+    global _conditional_cache_bytes
+    etag = response_headers.get("ETag")
+    last_modified = response_headers.get("Last-Modified")
+    with _conditional_cache_lock:
+        old = _conditional_cache.pop(url, None)
+        if old is not None:
+            _conditional_cache_bytes -= len(old[2])
+        # Nothing to revalidate with, or too big to be worth keeping
+        if not etag and not last_modified:
+            return
+        if len(body) > CONDITIONAL_CACHE_MAX_ENTRY_BYTES:
+            return
+        _conditional_cache[url] = (etag, last_modified, body)
+        _conditional_cache_bytes += len(body)
+        while (
+            len(_conditional_cache) > CONDITIONAL_CACHE_MAXSIZE
+            or _conditional_cache_bytes > CONDITIONAL_CACHE_MAX_BYTES
+        ):
+            _, evicted = _conditional_cache.popitem(last=False)
+            _conditional_cache_bytes -= len(evicted[2])
+
+
+def _append_unique(out: List[str], seen: set, urls: List[str]) -> None:
+    """Append the URLs not yet in seen to out, preserving first-seen order."""
+    for url in urls:
+        if url not in seen:
+            seen.add(url)
+            out.append(url)
+
+
+@functools.lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """Return the network location of url, memoized since the same base URLs recur."""
+    return urlsplit(url).netloc
+
+
+# Sitemaps at least this large are parsed in a worker process instead of on the
+# event loop; below it, pickling the body costs more than the parse itself.
+SITEMAP_PARSE_OFFLOAD_BYTES = 1024 * 1024
+# sitemaps.org limits a sitemap to 50 MB uncompressed; larger (or gzip-bomb) bodies
+# are rejected instead of being buffered
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024
+# Only a few huge sitemaps are ever parsed at once, so a small pool is enough
+SITEMAP_PARSE_MAX_WORKERS = 4
+_parse_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """Return the shared sitemap parse pool, starting it on first use."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # process_cpu_count() (3.13+) respects CPU affinity, unlike cpu_count()
+            cpu_count = getattr(os, "process_cpu_count", os.cpu_count)() or 1
+            # spawn: forking a process that holds running event loops and threads is
+            # unsafe. Each worker re-runs the parent's __main__ as __mp_main__ (server.py
+            # skips its app setup then) and unpickles the parse function from the
+            # lightweight sitemap_parser module.
+            _parse_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(SITEMAP_PARSE_MAX_WORKERS, cpu_count),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _parse_pool
+
+
+def _discard_parse_pool(pool: concurrent.futures.ProcessPoolExecutor) -> None:
+    """Drop a broken parse pool so the next large sitemap starts a fresh one."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is pool:
+            _parse_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+_WORKER_DONE = object()
+
+
+async def _iter_with_workers(
+    fn: Callable[[T], Awaitable[R]], items: Iterable[T], max_concurrent: int
+) -> AsyncIterator[R]:
+    """
+    Run fn over items with max_concurrent worker tasks, yielding results as they finish.
+
+    Items are fed through a bounded queue and results drained from another, so only
+    about 3 * max_concurrent items/results are in memory at once however long items
+    is. fn should handle its own errors; one that escapes is logged and that item
+    produces no result.
+    """
+    todo: asyncio.Queue = asyncio.Queue(maxsize=max_concurrent * 2)
+    done: asyncio.Queue = asyncio.Queue(maxsize=max_concurrent)
+
+    async def producer() -> None:
+        for item in items:
+            await todo.put(item)
+        for _ in range(max_concurrent):
+            await todo.put(_WORKER_DONE)
+
+    async def worker() -> None:
+        while (item := await todo.get()) is not _WORKER_DONE:
+            try:
+                result = await fn(item)
+            except Exception as e:
+                # Swallowed so the worker always reaches its exit marker below
+                logger.warning("❌ Worker failed on %s: %s", item, e)
+                continue
+            await done.put(result)
+        await done.put(_WORKER_DONE)
+
+    tasks = [asyncio.ensure_future(producer())]
+    tasks += [asyncio.ensure_future(worker()) for _ in range(max_concurrent)]
+    try:
+        running = max_concurrent
+        while running:
+            result = await done.get()
+            if result is _WORKER_DONE:
+                running -= 1
+            else:
+                yield result
+    finally:
+        # Consumer stopped early: don't leave work running
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class AdmissionGate:
+    """
+    Concurrency limiter like asyncio.Semaphore, but its cap can be changed while in use.
+
+    The slot count is an explicit counter guarded by an asyncio.Condition, so lowering
+    the cap mid-batch (e.g. on rate limiting) is safe: requests already admitted
+    finish, and new ones wait until the active count drops below the new cap.
+    """
+
+    # Upstream statuses that mean "slow down"
+    THROTTLE_STATUSES = (429, 503)
+
+    def __init__(self, cap: int):
+        self._active = 0
+        self._cap = max(1, cap)
+        self._cond = asyncio.Condition()
+
+    @property
+    def cap(self) -> int:
+        return self._cap
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._cap)
+            self._active += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def set_cap(self, cap: int) -> None:
+        """Change the cap (minimum 1), waking waiters if it grew."""
+        async with self._cond:
+            self._cap = max(1, cap)
+            self._cond.notify_all()
+
+    async def throttle(self) -> None:
+        """Admit one fewer concurrent request (never below 1)."""
+        if self._cap > 1:
+            await self.set_cap(self._cap - 1)
+            logger.warning("🐢 Upstream is throttling, concurrency lowered to %d", self._cap)
+
+    async def __aenter__(self) -> "AdmissionGate":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.release()
+
+
+# Reports at least this large trigger a full GC once built (see _collect_after_batch)
+GC_AFTER_REPORT_CHARS = 1_000_000
+
+
+def _collect_after_batch(report: str) -> str:
+    """
+    Run a full garbage collection after a large batch, then pass the report through.
+
+    Reference cycles left by a big batch (response objects, tracebacks of failed
+    reads) otherwise linger until the generational GC gets to them, keeping their
+    buffers and the arenas around them alive. Collecting once here frees them before
+    the next batch, so a long-running agent doesn't creep upward. Small reports skip
+    it, since a full collection briefly holds the GIL.
+    """
+    if len(report) >= GC_AFTER_REPORT_CHARS:
+        collected = gc.collect()
+        logger.debug("🧹 Collected %d objects after a %d-char report", collected, len(report))
+    return report
+
+
+# One long-lived event loop thread shared by every tool instance. The sync tool
+# entry points submit their coroutines here instead of starting a thread and a
+# fresh event loop on every call.
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_thread: Optional[threading.Thread] = None
+_bg_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting its thread on first use."""
+    global _bg_loop, _bg_thread
+    with _bg_loop_lock:
+        if _bg_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="webcrawler-loop", daemon=True
+            )
+            thread.start()
+            _bg_loop, _bg_thread = loop, thread
+        return _bg_loop
+
+
+def _run_in_background_loop(coro):
+    """Run coro on the background loop and block until it returns."""
+    loop = _get_background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("Cannot block on the background loop from inside it")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+# Keep-alive session for Jina Reader, shared by every batch run on the background
+# loop so TLS connections to r.jina.ai survive across tool calls and chat requests.
+# Only touched from the background loop's thread.
+_jina_shared_session: Optional[aiohttp.ClientSession] = None
+JINA_POOL_MAX_CONNECTIONS = 64
+
+
+async def _get_shared_jina_session() -> aiohttp.ClientSession:
+    """Return the background loop's Jina session, creating it on first use."""
+    global _jina_shared_session
+    if _jina_shared_session is None or _jina_shared_session.closed:
+        _jina_shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=JINA_POOL_MAX_CONNECTIONS, keepalive_timeout=30
+            )
+        )
+    return _jina_shared_session
+
+
+async def _close_shared_jina_session() -> None:
+    """Close the background loop's Jina session."""
+    global _jina_shared_session
+    if _jina_shared_session is not None and not _jina_shared_session.closed:
+        await _jina_shared_session.close()
+    _jina_shared_session = None
+
+
+def _shutdown_background_loop() -> None:
+    """Close the shared Jina session, stop the background loop and join its thread."""
+    global _bg_loop, _bg_thread
+    with _bg_loop_lock:
+        loop, thread = _bg_loop, _bg_thread
+        _bg_loop = _bg_thread = None
+    if loop is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_close_shared_jina_session(), loop).result(
+            timeout=5
+        )
+    except Exception as e:
+        logger.debug("⚠️ Failed to close shared Jina session: %s", e)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    if not thread.is_alive():
+        loop.close()
+
+
+atexit.register(_shutdown_background_loop)
+
+
+JINA_DEFAULT_CONCURRENCY = 10
+
+
+def _jina_concurrency_from_env() -> int:
+    """Read JINA_MAX_CONCURRENCY, falling back to the default if it isn't an integer."""
+    value = os.getenv("JINA_MAX_CONCURRENCY", "").strip()
+    if not value:
+        return JINA_DEFAULT_CONCURRENCY
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(
+            "⚠️ Invalid JINA_MAX_CONCURRENCY %r, using %d",
+            value,
+            JINA_DEFAULT_CONCURRENCY,
+        )
+        return JINA_DEFAULT_CONCURRENCY
 
 
 class WebCrawlerTool(Toolkit):
     """Web crawler tool using Jina Reader API for content extraction."""
 
-    def __init__(self, starting_urls: List[str] = None, api_key: Optional[str] = None):
+    # Upper bound (seconds) for reading a single PDF, so one slow host can't stall a batch
+    pdf_timeout: float = 30
+    # Max base URLs discovered at once; each discovery fans out into several fetches
+    discovery_concurrency: int = 5
+
+    def __init__(
+        self,
+        starting_urls: List[str] = None,
+        api_key: Optional[str] = None,
+        sitemap_concurrency: int = 16,
+    ):
         super().__init__()
         self.starting_urls = starting_urls or []
         self.allowed_domains = self._extract_domains_from_urls(self.starting_urls)
+        # Lowercased allow-list built once; None means every domain is allowed
+        self._allowed_suffixes = (
+            tuple(d.lower() for d in self.allowed_domains) or None
+        )
         self.api_key = api_key or os.getenv('JINA_API_KEY')
         self.jina_base_url = "https://r.jina.ai"
+        # Max Jina Reader requests in flight per batch (web pages and PDFs). The work is
+        # remote, so this follows the Jina plan's rate limit rather than local cores.
+        self.jina_concurrency = _jina_concurrency_from_env()
+        # Max nested sitemaps fetched at once per recursion level
+        self.sitemap_concurrency = sitemap_concurrency
+        # Shared pooled session for sitemap / llms.txt / base-page fetches (see _get_session)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
         self.register(self.crawl_selected_urls)
         self.register(self.process_pdf_urls)
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+
+        Sessions are bound to an event loop, so a new one is created whenever the
+        running loop differs from the one the current session was made in.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    # Sitemaps mostly live on one host, so this is the real concurrency cap
+                    limit_per_host=self.sitemap_concurrency,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                ),
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def _run_and_close(self, coro):
+        """Await coro, then close the shared session before its event loop is torn down."""
+        try:
+            return await coro
+        finally:
+            await self.close()
+
     def _extract_domains_from_urls(self, urls: List[str]) -> List[str]:
         """Extract unique domains from a list of URLs."""
-        domains = []
+        domains = {}  # insertion-ordered set
         for url in urls:
             try:
-                parsed = urlparse(url)
-                domain = parsed.netloc.lower()
-                if domain and domain not in domains:
-                    domains.append(domain)
-            except:
+                domain = urlsplit(url).netloc.lower()
+            except ValueError:  # e.g. malformed IPv6 host
                 continue
-        return domains
+            if domain:
+                domains[domain] = None
+        return list(domains)
 
     def is_allowed_domain(self, url: str) -> bool:
         """Check if URL is within allowed domains."""
-        if not self.allowed_domains:
-            return True
-
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            return any(
-                allowed_domain.lower() in domain
-                for allowed_domain in self.allowed_domains
-            )
-        except:
-            return False
+        return is_url_allowed(url, self._allowed_suffixes)
 
     def _ensure_valid_url(self, url: str) -> str:
         """Ensure URL has proper protocol."""
@@ -65,24 +519,95 @@ class WebCrawlerTool(Toolkit):
 
         return url
 
+    def _validate_url(self, url: str) -> Optional[str]:
+        """Return url with a protocol if it is non-empty and in an allowed domain, else None."""
+        validated_url = self._ensure_valid_url(url)
+        if validated_url and self.is_allowed_domain(validated_url):
+            return validated_url
+        return None
+
+    @staticmethod
+    def _normalize_url_input(urls) -> Sequence[str]:
+        """Accept a single URL string, a list/tuple, or any iterable of URLs."""
+        try:
+            # Lists and tuples (the common case) are used as-is; strings are never iterated
+            return (
+                (urls,)
+                if isinstance(urls, str)
+                else urls if isinstance(urls, (list, tuple)) else tuple(urls)
+            )
+        except TypeError:
+            return (str(urls),)  # Fallback for non-iterable types
+
     def _get_root_domain(self, url: str) -> str:
         """Extract root domain from any URL for discovery files."""
         try:
-            parsed = urlparse(url)
-            return f"{parsed.scheme}://{parsed.netloc}"
-        except:
+            parsed = urlsplit(url)
+        except ValueError:  # e.g. malformed IPv6 host
             return url
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    @contextlib.asynccontextmanager
+    async def _jina_session(self, max_connections: int) -> AsyncIterator[aiohttp.ClientSession]:
+        """
+        Yield a keep-alive session for a batch of Jina Reader requests.
+
+        On the background loop this is the shared pool that outlives the batch; anywhere
+        else (e.g. a caller driving its own event loop) a per-batch session is opened
+        and closed, since a session can't be reused across loops.
+        """
+        if asyncio.get_running_loop() is _bg_loop:
+            yield await _get_shared_jina_session()
+        else:
+            async with self._new_jina_session(max_connections) as session:
+                yield session
 
-    async def _jina_read_url(self, url: str, **options) -> str:
-        """Read a single URL using Jina Reader API."""
+    def _new_jina_session(self, max_connections: int) -> aiohttp.ClientSession:
+        """Create a keep-alive session for a batch of Jina Reader requests.
+
+        Every request goes to the same Jina host, so sharing one pooled session lets
+        the batch reuse a handful of TLS connections instead of opening one per URL.
+        """
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=max_connections, keepalive_timeout=30
+            )
+        )
+
+    async def _jina_fetch(
+        self,
+        url: str,
+        session: aiohttp.ClientSession,
+        gate: Optional[AdmissionGate] = None,
+        bypass_cache: bool = False,
+        **options,
+    ) -> Tuple[str, bool]:
+        """
+        Read a single URL using Jina Reader API (cached by URL, revalidated via ETag).
+
+        Args:
+            url: URL to read
+            session: Session the request is sent on (shared by the whole batch)
+            gate: Batch admission gate, throttled when Jina answers 429 / 503
+            bypass_cache: Always re-read the page; the fresh result is still cached
+
+        Returns:
+            (content, ok) - on failure content holds the error message and ok is False
+        """
         try:
+            options_key = tuple(sorted(options.items()))
+            cache_key = (url, options_key)
+            cached = None if bypass_cache else _jina_cache_get(cache_key)
+            if cached and time.time() - cached[0] < JINA_CACHE_TTL:
+                logger.debug("💾 Jina Reader cache hit for %s", url)
+                return cached[2], True
+
             jina_url = f"{self.jina_base_url}/{url}"
             headers = {}
             
             # Add authorization header if API key is available
             if self.api_key:
                 headers['Authorization'] = f'Bearer {self.api_key}'
-                print(f"🔑 Using Jina API key for higher rate limits")
             
             # Add custom options as headers if provided
             if 'timeout' in options:
@@ -94,68 +619,117 @@ class WebCrawlerTool(Toolkit):
             if 'gather_images' in options and options['gather_images']:
                 headers['X-With-Images-Summary'] = 'true'
 
-            async with aiohttp.ClientSession() as session:
-                start_time = time.time()
-                async with session.get(jina_url, headers=headers, timeout=30) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        crawl_time = time.time() - start_time
-                        print(f"⚡ Jina Reader processed {url} in {crawl_time:.2f}s - {len(content)} chars")
-                        return content
-                    else:
-                        error_msg = f"Jina Reader API error {response.status} for {url}"
-                        print(f"❌ {error_msg}")
-                        return f"Error: {error_msg}"
+            # Stale entry: ask the server whether it changed instead of re-reading it
+            if cached and cached[1]:
+                headers['If-None-Match'] = cached[1]
+
+            start_time = time.time()
+            async with session.get(jina_url, headers=headers, timeout=30) as response:
+                if response.status == 304 and cached:
+                    _jina_cache_put(cache_key, cached[1], cached[2])
+                    logger.debug("💾 Jina Reader content unchanged for %s", url)
+                    return cached[2], True
+                if response.status == 200:
+                    content = await response.text()
+                    crawl_time = time.time() - start_time
+                    logger.debug(
+                        "⚡ Jina Reader processed %s in %.2fs - %d chars",
+                        url,
+                        crawl_time,
+                        len(content),
+                    )
+                    _jina_cache_put(cache_key, response.headers.get('ETag'), content)
+                    return content, True
+                else:
+                    if gate is not None and response.status in gate.THROTTLE_STATUSES:
+                        await gate.throttle()
+                    error_msg = f"Jina Reader API error {response.status} for {url}"
+                    logger.warning("❌ %s", error_msg)
+                    return f"Error: {error_msg}", False
                         
         except Exception as e:
-            print(f"❌ Failed to read {url} with Jina Reader: {str(e)}")
-            return f"Error reading {url}: {str(e)}"
+            logger.warning("❌ Failed to read %s with Jina Reader: %s", url, e)
+            return f"Error reading {url}: {str(e)}", False
+
+    async def _jina_fetch_with_timeout(
+        self,
+        url: str,
+        read_timeout: Optional[float],
+        session: aiohttp.ClientSession,
+        gate: Optional[AdmissionGate] = None,
+        **options,
+    ) -> Tuple[str, bool]:
+        """Read a single URL, giving up after read_timeout seconds (None = no limit)."""
+        try:
+            return await asyncio.wait_for(
+                self._jina_fetch(url, session=session, gate=gate, **options),
+                timeout=read_timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning("⏱️ Jina Reader timed out after %ss for %s", read_timeout, url)
+            return f"Error: timeout after {read_timeout}s", False
+
+    async def _iter_jina_reads(
+        self, urls: List[str], read_timeout: Optional[float] = None, **options
+    ) -> AsyncIterator[Tuple[str, str, bool]]:
+        """
+        Read multiple URLs concurrently using Jina Reader API, yielding (url, content, ok)
+        tuples in completion order.
 
-    async def _jina_read_multiple_urls(self, urls: List[str], **options) -> List[Tuple[str, str]]:
-        """Read multiple URLs concurrently using Jina Reader API."""
+        Each result can be formatted and dropped as soon as it arrives instead of the
+        whole batch being held until the slowest URL finishes. If read_timeout is given,
+        each URL is abandoned after that many seconds and yielded as a failed read.
+        """
         if not urls:
-            return []
+            return
 
         start_time = time.time()
         
         # Smart concurrency - Jina Reader can handle high concurrency
-        max_concurrent = min(len(urls), 10)  # Higher than crawl4ai since it's just API calls
-        semaphore = asyncio.Semaphore(max_concurrent)
+        max_concurrent = min(len(urls), self.jina_concurrency)
 
-        print(f"🚀 Starting Jina Reader batch processing of {len(urls)} URLs with {max_concurrent} concurrent workers")
-
-        async def read_with_concurrency_limit(url: str) -> Tuple[str, str]:
-            """Read a single URL with concurrency limiting."""
-            async with semaphore:
-                content = await self._jina_read_url(url, **options)
-                return url, content
+        logger.info(
+            "🚀 Starting Jina Reader batch processing of %d URLs with %d concurrent workers",
+            len(urls),
+            max_concurrent,
+        )
 
-        # Create tasks for all URLs
-        tasks = [read_with_concurrency_limit(url) for url in urls]
+        # Lowered on 429 / 503 so the batch backs off instead of hammering Jina
+        gate = AdmissionGate(max_concurrent)
 
-        # Use asyncio.gather for maximum parallel execution
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def read_one(url: str) -> Tuple[str, str, bool]:
+            """Read a single URL, turning any exception into a failed result."""
+            try:
+                async with gate:
+                    content, ok = await self._jina_fetch_with_timeout(
+                        url, read_timeout, session=session, gate=gate, **options
+                    )
+            except Exception as e:
+                logger.warning("❌ Failed to read %s: %s", url, e)
+                return url, f"Exception: {str(e)}", False
+            return url, content, ok
 
-        # Process results and handle exceptions
-        processed_results = []
         successful_reads = 0
         failed_reads = 0
 
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append((urls[i], f"Exception: {str(result)}"))
-                failed_reads += 1
-                print(f"❌ Failed to read {urls[i]}: {str(result)}")
-            else:
-                processed_results.append(result)
-                successful_reads += 1
+        async with self._jina_session(max_concurrent) as session:
+            async for result in _iter_with_workers(read_one, urls, max_concurrent):
+                if result[2]:
+                    successful_reads += 1
+                else:
+                    failed_reads += 1
+                yield result
 
         total_time = time.time() - start_time
         avg_time_per_url = total_time / len(urls) if urls else 0
 
-        print(f"⚡ Completed Jina Reader batch: {successful_reads} successful, {failed_reads} failed in {total_time:.2f}s (avg {avg_time_per_url:.2f}s per URL)")
-
-        return processed_results
+        logger.info(
+            "⚡ Completed Jina Reader batch: %d successful, %d failed in %.2fs (avg %.2fs per URL)",
+            successful_reads,
+            failed_reads,
+            total_time,
+            avg_time_per_url,
+        )
 
     async def discover_urls_from_sources(
         self, input_url: str, bypass_cache: bool = False
@@ -164,12 +738,17 @@ class WebCrawlerTool(Toolkit):
         Five-step discovery with enhanced sitemap support:
         1. llms.txt content
         2. sitemap.xml URLs (with recursive fetching)
-        3. sitemap/sitemap.xml URLs (with recursive fetching)
-        4. sitemap_index.xml URLs (with recursive fetching)
+        3. sitemap_index.xml URLs (with recursive fetching)
+        4. sitemap/sitemap.xml URLs (with recursive fetching)
         5. base page content (fallback)
+
+        Steps 1-4 are independent, so llms.txt and the top-level sitemap at each
+        location are fetched concurrently. Nested sitemaps are then followed only
+        for the first location (in the order above) that has entries; the next one
+        is expanded only if that yields no URLs.
         """
         root_domain = self._get_root_domain(input_url)
-        print(f"🔍 Discovering content from: {root_domain}")
+        logger.debug("🔍 Discovering content from: %s", root_domain)
 
         sources = {
             "llms_txt_content": "",
@@ -178,159 +757,206 @@ class WebCrawlerTool(Toolkit):
         }
 
         try:
-            # Step 1: Always try llms.txt first
-            llms_content = await self._get_content_from_llms_txt(
-                f"{root_domain}/llms.txt"
-            )
-            if llms_content:
-                sources["llms_txt_content"] = llms_content
-                print(f"✅ Found llms.txt content ({len(llms_content)} chars)")
-
-            # Step 2: Try sitemap.xml (with recursive fetching)
-            print(f"🔍 Checking sitemap.xml with recursive fetching...")
-            sitemap_urls = await self._get_urls_from_sitemap(
-                f"{root_domain}/sitemap.xml"
+            # Steps 1-4: llms.txt and every sitemap location at once
+            logger.debug("🔍 Checking llms.txt and sitemap locations with recursive fetching...")
+            sitemap_candidates = [
+                f"{root_domain}/sitemap.xml",
+                f"{root_domain}/sitemap_index.xml",
+                f"{root_domain}/sitemap/sitemap.xml",
+            ]
+            llms_content, *probes = await asyncio.gather(
+                self._get_content_from_llms_txt(f"{root_domain}/llms.txt"),
+                *(self._probe_sitemap(url) for url in sitemap_candidates),
+                return_exceptions=True,
             )
 
-            # Step 3: If both fail, try sitemap_index.xml (with recursive fetching)
-            if not sitemap_urls:
-                print(
-                    f"🔍 sitemap/sitemap.xml failed, trying sitemap_index.xml with recursive fetching..."
-                )
-                sitemap_urls = await self._get_urls_from_sitemap(
-                    f"{root_domain}/sitemap_index.xml"
-                )
+            if isinstance(llms_content, str) and llms_content:
+                sources["llms_txt_content"] = llms_content
+                logger.debug("✅ Found llms.txt content (%d chars)", len(llms_content))
 
-            # Step 4: If sitemap.xml fails, try sitemap/sitemap.xml (with recursive fetching)
-            if not sitemap_urls:
-                print(
-                    f"🔍 sitemap.xml failed, trying sitemap/sitemap.xml with recursive fetching..."
-                )
+            sitemap_urls = []
+            # Shared by every expansion, so no nested sitemap is fetched twice
+            visited = set()
+            for sitemap_url, parsed_data in zip(sitemap_candidates, probes):
+                if not isinstance(parsed_data, dict) or not (
+                    parsed_data["page_urls"] or parsed_data["sitemap_urls"]
+                ):
+                    continue
                 sitemap_urls = await self._get_urls_from_sitemap(
-                    f"{root_domain}/sitemap/sitemap.xml"
+                    sitemap_url, parsed_data, visited
                 )
+                if sitemap_urls:
+                    break
 
             if sitemap_urls:
                 sources["sitemap_urls"] = sitemap_urls
-                print(
-                    f"✅ Found {len(sitemap_urls)} URLs from sitemap discovery (including recursive)"
+                logger.debug(
+                    "✅ Found %d URLs from sitemap discovery (including recursive)",
+                    len(sitemap_urls),
                 )
 
             # Step 5: Fallback to base page content using Jina Reader (only if no sitemap URLs found)
             if not sources["sitemap_urls"]:
-                print(f"📄 No sitemap URLs found, falling back to base page content with Jina Reader...")
+                logger.debug(
+                    "📄 No sitemap URLs found, falling back to base page content with Jina Reader..."
+                )
                 try:
                     # Replace crawl4ai call with Jina Reader API call
-                    content = await self._jina_read_url(input_url)
-                    if content and not content.startswith("Error"):
+                    content, ok = await self._jina_fetch(
+                        input_url,
+                        session=await self._get_session(),
+                        bypass_cache=bypass_cache,
+                    )
+                    if ok and content:
                         sources["base_page_content"] = content
-                        print(f"✅ Found {len(content)} characters of content from base page via Jina Reader")
+                        logger.debug(
+                            "✅ Found %d characters of content from base page via Jina Reader",
+                            len(content),
+                        )
                     else:
-                        print("⚠️ No content found on base page")
+                        logger.debug("⚠️ No content found on base page")
                 except Exception as e:
-                    print(f"⚠️ Base page reading failed: {e}")
+                    logger.warning("⚠️ Base page reading failed: %s", e)
 
         except Exception as e:
-            print(f"⚠️ Discovery error: {e}")
+            logger.warning("⚠️ Discovery error: %s", e)
 
         return sources
 
     async def _get_content_from_llms_txt(self, llms_url: str) -> str:
         """Get full content from llms.txt file."""
         try:
-            print(f"🔍 Checking llms.txt at: {llms_url}")
-            async with aiohttp.ClientSession() as session:
-                async with session.get(llms_url, timeout=10) as response:
-                    print(f"📄 llms.txt response status: {response.status}")
-
-                    if response.status == 200:
-                        content = await response.text()
-                        print(f"📄 llms.txt content length: {len(content)} chars")
-                        print(f"📄 llms.txt content preview: {content[:200]}...")
-
-                        # Return the full content instead of parsing for URLs
-                        print(
-                            f"✅ Retrieved full llms.txt content ({len(content)} characters)"
-                        )
-                        return content.strip()
-                    else:
-                        print(f"❌ llms.txt not found (status {response.status})")
+            logger.debug("🔍 Checking llms.txt at: %s", llms_url)
+            headers, cached = _conditional_request(llms_url)
+            session = await self._get_session()
+            async with session.get(llms_url, headers=headers) as response:
+                logger.debug("📄 llms.txt response status: %d", response.status)
+
+                if response.status == 304 and cached:
+                    logger.debug("✅ llms.txt not modified, using cached content")
+                    return cached[2].strip()
+                if response.status == 200:
+                    content = await response.text()
+                    _conditional_cache_put(llms_url, response.headers, content)
+                    # Return the full content instead of parsing for URLs
+                    logger.debug(
+                        "✅ Retrieved full llms.txt content (%d characters)", len(content)
+                    )
+                    return content.strip()
+                else:
+                    logger.debug("❌ llms.txt not found (status %d)", response.status)
 
         except Exception as e:
-            print(f"❌ llms.txt parsing error: {e}")
-            import traceback
-
-            print(f"❌ Full traceback: {traceback.format_exc()}")
+            logger.debug("❌ llms.txt fetch error: %s", e)
 
         return ""
 
-    async def _fetch_sitemap_content(self, sitemap_url: str) -> str:
+    async def _fetch_sitemap_content(self, sitemap_url: str) -> bytes:
         """
         Fetch sitemap content with proper error handling.
-        Returns empty string on failure (not exception).
+        Returns empty bytes on failure (not exception).
+
+        The raw body is handed to lxml undecoded so the XML's own encoding
+        declaration is honored and the buffer isn't copied into a str.
         """
         try:
-            print(f"🔍 Fetching sitemap: {sitemap_url}")
-            async with aiohttp.ClientSession() as session:
-                async with session.get(sitemap_url, timeout=10) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        print(f"✅ Sitemap fetched successfully ({len(content)} chars)")
-                        return content
-                    else:
-                        print(f"❌ Sitemap {sitemap_url} returned {response.status}")
-                        return ""
+            logger.debug("🔍 Fetching sitemap: %s", sitemap_url)
+            headers, cached = _conditional_request(sitemap_url)
+            session = await self._get_session()
+            async with session.get(sitemap_url, headers=headers) as response:
+                if response.status == 304 and cached:
+                    logger.debug("✅ Sitemap not modified, using cached content")
+                    return cached[2]
+                if response.status == 200:
+                    content = await self._read_sitemap_body(response)
+                    _conditional_cache_put(sitemap_url, response.headers, content)
+                    logger.debug("✅ Sitemap fetched successfully (%d bytes)", len(content))
+                    return content
+                else:
+                    logger.debug("❌ Sitemap %s returned %d", sitemap_url, response.status)
+                    return b""
         except Exception as e:
-            print(f"❌ Failed to fetch sitemap {sitemap_url}: {e}")
-            return ""
+            logger.debug("❌ Failed to fetch sitemap %s: %s", sitemap_url, e)
+            return b""
+
+    async def _read_sitemap_body(self, response: aiohttp.ClientResponse) -> bytes:
+        """
+        Read a sitemap response in chunks, gunzipping .xml.gz files on the fly.
+
+        aiohttp already decodes Content-Encoding: gzip; this handles sitemaps that
+        are themselves gzip files (served as application/x-gzip and friends).
+
+        Raises ValueError once the (decompressed) body passes SITEMAP_MAX_BYTES.
+        """
+        chunks = []
+        total = 0
+        decompressor = None
+        first = True
+        async for chunk in response.content.iter_chunked(65536):
+            if first:
+                first = False
+                if chunk[:2] == b"\x1f\x8b":  # gzip magic number
+                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            if decompressor:
+                # max_length stops inflating one byte past the cap, so a tiny
+                # compressed chunk can't expand into gigabytes
+                chunk = decompressor.decompress(chunk, SITEMAP_MAX_BYTES - total + 1)
+            total += len(chunk)
+            if total > SITEMAP_MAX_BYTES:
+                raise ValueError(f"sitemap larger than {SITEMAP_MAX_BYTES} bytes")
+            chunks.append(chunk)
+        if decompressor:
+            chunks.append(decompressor.flush())
+        return b"".join(chunks)
 
     def _parse_sitemap_xml(
-        self, xml_content: str, base_url: str
+        self, xml_content: bytes, base_url: str
     ) -> Dict[str, List[str]]:
         """
         Parse XML and determine if it's:
         - Regular sitemap (has <url> elements)
         - Sitemap index (has <sitemap> elements)
         """
-        try:
-            time.sleep(1)
-            root = ET.fromstring(xml_content)
+        page_urls, sitemap_urls = parse_sitemap_xml(
+            xml_content, base_url, self._allowed_suffixes
+        )
+        return {"page_urls": page_urls, "sitemap_urls": sitemap_urls}
 
-            # Remove namespace for easier parsing
-            for elem in root.iter():
-                if "}" in elem.tag:
-                    elem.tag = elem.tag.split("}")[1]
+    async def _parse_sitemap_xml_async(
+        self, xml_content: bytes, base_url: str
+    ) -> Dict[str, List[str]]:
+        """
+        Parse a sitemap without blocking the event loop on large documents.
 
-            page_urls = []
-            sitemap_urls = []
+        Bodies above SITEMAP_PARSE_OFFLOAD_BYTES are parsed in the shared process
+        pool so several multi-MB sitemaps can be crunched in parallel while the
+        loop keeps fetching; small ones are cheaper to parse inline.
+        """
+        if len(xml_content) < SITEMAP_PARSE_OFFLOAD_BYTES:
+            return self._parse_sitemap_xml(xml_content, base_url)
 
-            # Check for regular sitemap structure
-            for url_elem in root.findall(".//url"):
-                loc_elem = url_elem.find("loc")
-                if loc_elem is not None and loc_elem.text:
-                    full_url = urljoin(base_url, loc_elem.text.strip())
-                    if self.is_allowed_domain(full_url):
-                        page_urls.append(full_url)
-
-            # Check for sitemap index structure
-            for sitemap_elem in root.findall(".//sitemap"):
-                loc_elem = sitemap_elem.find("loc")
-                if loc_elem is not None and loc_elem.text:
-                    full_url = urljoin(base_url, loc_elem.text.strip())
-                    if self.is_allowed_domain(full_url):
-                        sitemap_urls.append(full_url)
-
-            print(
-                f"📋 Parsed XML: {len(page_urls)} page URLs, {len(sitemap_urls)} nested sitemaps"
+        loop = asyncio.get_running_loop()
+        pool = _get_parse_pool()
+        try:
+            page_urls, sitemap_urls = await loop.run_in_executor(
+                pool,
+                parse_sitemap_xml,
+                xml_content,
+                base_url,
+                self._allowed_suffixes,
             )
-            return {"page_urls": page_urls, "sitemap_urls": sitemap_urls}
-
-        except ET.ParseError as e:
-            print(f"❌ XML parsing error: {e}")
-            return {"page_urls": [], "sitemap_urls": []}
+        except concurrent.futures.process.BrokenProcessPool as e:
+            logger.warning("⚠️ Sitemap parse pool unavailable, parsing inline: %s", e)
+            _discard_parse_pool(pool)
+            return self._parse_sitemap_xml(xml_content, base_url)
+        return {"page_urls": page_urls, "sitemap_urls": sitemap_urls}
 
     async def _fetch_recursive_sitemaps(
-        self, sitemap_urls: List[str], depth: int = 0, max_depth: int = 3
+        self,
+        sitemap_urls: List[str],
+        depth: int = 0,
+        max_depth: int = 3,
+        visited: Optional[set] = None,
     ) -> List[str]:
         """
         Recursively fetch all nested sitemaps and extract URLs.
@@ -339,107 +965,141 @@ class WebCrawlerTool(Toolkit):
             sitemap_urls: List of sitemap URLs to fetch
             depth: Current recursion depth
             max_depth: Maximum recursion depth to prevent infinite loops
+            visited: Sitemap URLs already fetched anywhere in this discovery; shared
+                across branches so cross-referenced sitemaps are fetched only once
 
         Returns:
             List of all page URLs found in all nested sitemaps
         """
         if depth >= max_depth:
-            print(
-                f"⚠️ Maximum recursion depth ({max_depth}) reached, stopping sitemap fetching"
+            logger.debug(
+                "⚠️ Maximum recursion depth (%d) reached, stopping sitemap fetching",
+                max_depth,
             )
             return []
 
+        if visited is None:
+            visited = set()
+        sitemap_urls = [url for url in dict.fromkeys(sitemap_urls) if url not in visited]
+        visited.update(sitemap_urls)
+        if not sitemap_urls:
+            return []
+
         all_urls = []
+        seen = set()
 
         # Fetch all sitemaps concurrently (with limit)
-        semaphore = asyncio.Semaphore(3)  # Limit concurrent requests
+        semaphore = asyncio.Semaphore(self.sitemap_concurrency)
 
         async def fetch_single_sitemap(sitemap_url: str) -> List[str]:
-            async with semaphore:
-                try:
+            try:
+                # Only the fetch + parse hold a slot; nested levels get their own
+                async with semaphore:
                     # Fetch sitemap content
                     sitemap_content = await self._fetch_sitemap_content(sitemap_url)
                     if not sitemap_content:
                         return []
 
                     # Parse the nested sitemap
-                    parsed_data = self._parse_sitemap_xml(sitemap_content, sitemap_url)
+                    parsed_data = await self._parse_sitemap_xml_async(
+                        sitemap_content, sitemap_url
+                    )
 
-                    urls_from_this_sitemap = []
+                urls_from_this_sitemap = []
 
-                    # Add page URLs from this sitemap
-                    urls_from_this_sitemap.extend(parsed_data["page_urls"])
+                # Add page URLs from this sitemap
+                urls_from_this_sitemap.extend(parsed_data["page_urls"])
 
-                    # If this sitemap also has nested sitemaps, fetch them recursively
-                    if parsed_data["sitemap_urls"]:
-                        print(
-                            f"🔄 Sitemap {sitemap_url} has {len(parsed_data['sitemap_urls'])} more nested sitemaps"
-                        )
-                        deeper_urls = await self._fetch_recursive_sitemaps(
-                            parsed_data["sitemap_urls"], depth + 1, max_depth
-                        )
-                        urls_from_this_sitemap.extend(deeper_urls)
+                # If this sitemap also has nested sitemaps, fetch them recursively
+                if parsed_data["sitemap_urls"]:
+                    logger.debug(
+                        "🔄 Sitemap %s has %d more nested sitemaps",
+                        sitemap_url,
+                        len(parsed_data["sitemap_urls"]),
+                    )
+                    deeper_urls = await self._fetch_recursive_sitemaps(
+                        parsed_data["sitemap_urls"], depth + 1, max_depth, visited
+                    )
+                    urls_from_this_sitemap.extend(deeper_urls)
 
-                    return urls_from_this_sitemap
+                return urls_from_this_sitemap
 
-                except Exception as e:
-                    print(f"❌ Failed to fetch nested sitemap {sitemap_url}: {e}")
-                    return []
+            except Exception as e:
+                logger.warning("❌ Failed to fetch nested sitemap %s: %s", sitemap_url, e)
+                return []
 
         # Fetch all sitemaps concurrently
         tasks = [fetch_single_sitemap(url) for url in sitemap_urls]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Combine results
+        # Combine results, dropping duplicates while preserving order
         for result in results:
             if isinstance(result, list):
-                all_urls.extend(result)
+                _append_unique(all_urls, seen, result)
             else:
-                print(f"⚠️ Sitemap fetch returned exception: {result}")
-
-        # Remove duplicates while preserving order
-        unique_urls = list(dict.fromkeys(all_urls))
+                logger.warning("⚠️ Sitemap fetch returned exception: %s", result)
 
-        print(
-            f"📊 Recursive sitemap fetching (depth {depth}) found {len(unique_urls)} unique URLs"
+        logger.debug(
+            "📊 Recursive sitemap fetching (depth %d) found %d unique URLs",
+            depth,
+            len(all_urls),
         )
-        return unique_urls
+        return all_urls
 
-    async def _get_urls_from_sitemap(self, sitemap_url: str) -> List[str]:
+    async def _probe_sitemap(self, sitemap_url: str) -> Dict[str, List[str]]:
         """
-        Process any sitemap with automatic recursive fetching.
+        Fetch and parse a single sitemap without following its nested sitemaps.
+
+        Discovery probes every candidate location this way and only expands the
+        winner, so losing candidates never trigger recursive fetches.
         """
         try:
-            # Fetch the initial sitemap
             sitemap_content = await self._fetch_sitemap_content(sitemap_url)
-            if not sitemap_content:
-                return []
+            if sitemap_content:
+                return await self._parse_sitemap_xml_async(sitemap_content, sitemap_url)
+        except Exception as e:
+            logger.warning("❌ Failed to process sitemap %s: %s", sitemap_url, e)
+        return {"page_urls": [], "sitemap_urls": []}
+
+    async def _get_urls_from_sitemap(
+        self,
+        sitemap_url: str,
+        parsed_data: Dict[str, List[str]],
+        visited: Optional[set] = None,
+    ) -> List[str]:
+        """
+        Expand an already-probed sitemap with automatic recursive fetching.
 
-            # Parse XML to get both page URLs and nested sitemap URLs
-            parsed_data = self._parse_sitemap_xml(sitemap_content, sitemap_url)
+        visited collects every sitemap URL fetched, so nested sitemaps that are
+        referenced more than once are only fetched and parsed once.
+        """
+        if visited is None:
+            visited = set()
+        visited.add(sitemap_url)
 
+        try:
             all_urls = []
+            seen = set()
 
             # Add direct page URLs (if any)
-            all_urls.extend(parsed_data["page_urls"])
+            _append_unique(all_urls, seen, parsed_data["page_urls"])
 
             # If there are nested sitemaps, fetch them recursively
             if parsed_data["sitemap_urls"]:
-                print(
-                    f"🔄 Found {len(parsed_data['sitemap_urls'])} nested sitemaps in {sitemap_url}"
+                logger.debug(
+                    "🔄 Found %d nested sitemaps in %s",
+                    len(parsed_data["sitemap_urls"]),
+                    sitemap_url,
                 )
                 nested_urls = await self._fetch_recursive_sitemaps(
-                    parsed_data["sitemap_urls"]
+                    parsed_data["sitemap_urls"], visited=visited
                 )
-                all_urls.extend(nested_urls)
-
-            # Remove duplicates
-            unique_urls = list(dict.fromkeys(all_urls))
+                _append_unique(all_urls, seen, nested_urls)
 
-            return unique_urls
+            return all_urls
 
         except Exception as e:
-            print(f"❌ Failed to process sitemap {sitemap_url}: {e}")
+            logger.warning("❌ Failed to process sitemap %s: %s", sitemap_url, e)
             return []
 
     def discover_site_structure(self, urls) -> str:
@@ -456,61 +1116,36 @@ class WebCrawlerTool(Toolkit):
             str: Formatted content from all sources (llms.txt content, base page content)
         """
         try:
-            # Fix input type handling - ensure urls is always a list
-            if isinstance(urls, str):
-                urls = [urls]  # Convert single string to list
-            elif not isinstance(urls, (list, tuple)):
-                # Handle other iterables, but prevent string iteration
-                try:
-                    urls = list(urls)
-                except TypeError:
-                    urls = [str(urls)]  # Fallback for non-iterable types
+            urls = self._normalize_url_input(urls)
 
-            print(f"🔧 Processing {len(urls)} URL(s) for site structure discovery")
+            logger.info("🔧 Processing %d URL(s) for site structure discovery", len(urls))
 
             # Validate URLs
-            url_list = []
-            for url in urls:
-                print(f"🔗 Validating URL: {url}")
-                url = url.strip()
-                if url:
-                    validated_url = self._ensure_valid_url(url)
-                    if validated_url and self.is_allowed_domain(validated_url):
-                        url_list.append(validated_url)
-                    elif validated_url:
-                        print(f"⚠️ URL not in allowed domains: {validated_url}")
+            url_list = [v for u in urls if (v := self._validate_url(u.strip()))]
+            if len(url_list) < len(urls):
+                logger.warning(
+                    "⚠️ Skipped %d empty or out-of-domain URL(s)", len(urls) - len(url_list)
+                )
 
             if not url_list:
                 return "❌ No valid URLs provided or all URLs outside allowed domains"
 
-            print(
-                f"🔍 Discovering site structure for {len(url_list)} URLs: {', '.join([urlparse(u).netloc for u in url_list])} (Using Jina Reader)"
+            logger.info(
+                "🔍 Discovering site structure for %d URLs: %s (Using Jina Reader)",
+                len(url_list),
+                ", ".join(_netloc(u) for u in url_list),
             )
 
-            # Handle async discovery properly for multiple URLs
-            try:
-                loop = asyncio.get_running_loop()
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        self._run_multi_discovery, url_list, False
-                    )
-                    combined_discovered = future.result()
-            except RuntimeError:
-                combined_discovered = asyncio.run(
-                    self._discover_multiple_urls(url_list, False)
-                )
+            # Works whether or not the caller is already inside an event loop
+            combined_discovered = _run_in_background_loop(
+                self._run_and_close(self._discover_multiple_urls(url_list, False))
+            )
 
             return self._format_multi_discovery_results(combined_discovered, url_list)
 
         except Exception as e:
             return f"❌ Error in discover_site_structure: {str(e)}"
 
-    def _run_multi_discovery(self, url_list, bypass_cache=False):
-        """Helper method to run multi-URL discovery in a new event loop."""
-        return asyncio.run(self._discover_multiple_urls(url_list, bypass_cache))
-
     async def _discover_multiple_urls(
         self, url_list: List[str], bypass_cache: bool = False
     ) -> Dict[str, List[Tuple[str, str]]]:
@@ -521,17 +1156,23 @@ class WebCrawlerTool(Toolkit):
             "base_page_content": [],
         }
 
-        # Run discovery for each URL concurrently
-        tasks = [self.discover_urls_from_sources(url, bypass_cache) for url in url_list]
+        # Run discovery for each URL concurrently (with limit)
+        semaphore = asyncio.Semaphore(min(len(url_list), self.discovery_concurrency))
+
+        async def discover_with_limit(url: str) -> Dict[str, str]:
+            async with semaphore:
+                return await self.discover_urls_from_sources(url, bypass_cache)
+
+        tasks = [discover_with_limit(url) for url in url_list]
         all_results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Combine results from all URLs with source attribution
         for i, result in enumerate(all_results):
             if isinstance(result, Exception):
-                print(f"⚠️ Discovery failed for {url_list[i]}: {result}")
+                logger.warning("⚠️ Discovery failed for %s: %s", url_list[i], result)
                 continue
 
-            base_domain = urlparse(url_list[i]).netloc
+            base_domain = _netloc(url_list[i])
 
             # Handle different result types
             if "llms_txt_content" in result and result["llms_txt_content"]:
@@ -558,15 +1199,14 @@ class WebCrawlerTool(Toolkit):
         self, discovered: Dict[str, List[Tuple[str, str]]], url_list: List[str]
     ) -> str:
         """Format multi-URL discovery results with source attribution."""
-        output = []
-        output.append("=== CONTENT DISCOVERY ===")
+        buf = io.StringIO()
+        w = buf.write
+        w("=== CONTENT DISCOVERY ===\n")
 
         # Show which base URLs were discovered from
-        domains = [urlparse(url).netloc for url in url_list]
-        output.append(
-            f"🔍 Discovered from {len(url_list)} base URLs: {', '.join(domains)}"
-        )
-        output.append("")
+        domains = [_netloc(url) for url in url_list]
+        w(f"🔍 Discovered from {len(url_list)} base URLs: {', '.join(domains)}\n")
+        w("\n")
 
         total_content_sources = 0
 
@@ -574,23 +1214,18 @@ class WebCrawlerTool(Toolkit):
         llms_content = discovered.get("llms_txt_content", [])
         if llms_content:
             total_content_sources += len(llms_content)
-            output.append(
-                f"📋 From llms.txt ({len(llms_content)} AI-optimized content sources found):"
-            )
+            w(f"📋 From llms.txt ({len(llms_content)} AI-optimized content sources found):\n")
             for i, (base_domain, content) in enumerate(llms_content, 1):
-                output.append(
-                    f"  [{base_domain}] llms.txt content ({len(content)} chars):"
-                )
-                output.append(f"{content}")
-                output.append("")
+                w(f"  [{base_domain}] llms.txt content ({len(content)} chars):\n")
+                w(content)
+                w("\n\n")
 
         # Format sitemap URLs (second priority) with source attribution
         sitemap_data = discovered.get("sitemap_urls", [])
+        # len() is O(1), so this is one pass over domains, not over URLs
+        total_sitemap_urls = sum(len(urls) for _, urls in sitemap_data)
         if sitemap_data:
-            total_sitemap_urls = sum(len(urls) for _, urls in sitemap_data)
-            output.append(
-                f"🗺️ From sitemap discovery ({len(sitemap_data)} domains, {total_sitemap_urls} URLs found):"
-            )
+            w(f"🗺️ From sitemap discovery ({len(sitemap_data)} domains, {total_sitemap_urls} URLs found):\n")
             
             # Limit to top 200 URLs total across all domains
             url_count = 0
@@ -599,66 +1234,52 @@ class WebCrawlerTool(Toolkit):
             for i, (base_domain, urls) in enumerate(sitemap_data, 1):
                 remaining_slots = max_urls - url_count
                 if remaining_slots <= 0:
-                    output.append(f"  ... and {len(sitemap_data) - i + 1} more domains with URLs truncated due to 200 URL limit")
+                    w(f"  ... and {len(sitemap_data) - i + 1} more domains with URLs truncated due to 200 URL limit\n")
                     break
                 
                 urls_to_show = urls[:remaining_slots]
                 if len(urls) > len(urls_to_show):
-                    output.append(f"  [{base_domain}] {len(urls_to_show)} URLs shown (of {len(urls)} total):")
+                    w(f"  [{base_domain}] {len(urls_to_show)} URLs shown (of {len(urls)} total):\n")
                 else:
-                    output.append(f"  [{base_domain}] {len(urls_to_show)} URLs discovered:")
+                    w(f"  [{base_domain}] {len(urls_to_show)} URLs discovered:\n")
                 
-                # Show URLs up to the limit
-                for j, url in enumerate(urls_to_show, 1):
-                    output.append(f"    {j}. {url}")
-                    url_count += 1
+                # Show URLs up to the limit, written in one go
+                if urls_to_show:
+                    w("\n".join(f"    {j}. {url}" for j, url in enumerate(urls_to_show, 1)))
+                    w("\n")
+                url_count += len(urls_to_show)
                 
                 if len(urls) > len(urls_to_show):
-                    output.append(f"    ... and {len(urls) - len(urls_to_show)} more URLs truncated")
-                output.append("")
+                    w(f"    ... and {len(urls) - len(urls_to_show)} more URLs truncated\n")
+                w("\n")
 
         # Format base page content (fallback) with source attribution
         base_content = discovered.get("base_page_content", [])
         if base_content:
             total_content_sources += len(base_content)
-            output.append(
-                f"📄 From base page crawls ({len(base_content)} pages found):"
-            )
+            w(f"📄 From base page crawls ({len(base_content)} pages found):\n")
             for i, (base_domain, content) in enumerate(base_content, 1):
-                output.append(f"  [{base_domain}] Page {i} ({len(content)} chars):")
-                output.append(f"{content}")
-                output.append("")
+                w(f"  [{base_domain}] Page {i} ({len(content)} chars):\n")
+                w(content)
+                w("\n\n")
 
         # Summary
-        output.append("=== DISCOVERY SUMMARY ===")
-        total_sitemap_urls = sum(
-            len(urls) for _, urls in discovered.get("sitemap_urls", [])
-        )
-        output.append(f"Total content sources discovered: {total_content_sources}")
-        output.append(f"Total sitemap URLs discovered: {total_sitemap_urls}")
+        w("=== DISCOVERY SUMMARY ===\n")
+        w(f"Total content sources discovered: {total_content_sources}\n")
+        w(f"Total sitemap URLs discovered: {total_sitemap_urls}")
 
         if llms_content:
-            output.append(
-                "💡 llms.txt content is immediately available for answering questions."
-            )
+            w("\n💡 llms.txt content is immediately available for answering questions.")
         if total_sitemap_urls > 0:
-            output.append(
-                "💡 Use 'crawl_selected_urls' to crawl specific URLs from the sitemap that are relevant to your question."
-            )
+            w("\n💡 Use 'crawl_selected_urls' to crawl specific URLs from the sitemap that are relevant to your question.")
         if base_content:
-            output.append(
-                "💡 Base page content is immediately available for answering questions."
-            )
+            w("\n💡 Base page content is immediately available for answering questions.")
 
         if total_content_sources == 0 and total_sitemap_urls == 0:
-            output.append(
-                "\n⚠️ No content or URLs discovered from any source (llms.txt, sitemap, or base page crawls)."
-            )
-            output.append(
-                "You can still crawl the base URLs directly using 'crawl_selected_urls'."
-            )
+            w("\n\n⚠️ No content or URLs discovered from any source (llms.txt, sitemap, or base page crawls).")
+            w("\nYou can still crawl the base URLs directly using 'crawl_selected_urls'.")
 
-        return "\n".join(output)
+        return buf.getvalue()
 
     def crawl_selected_urls(self, urls) -> str:
         """
@@ -674,79 +1295,70 @@ class WebCrawlerTool(Toolkit):
             str: Formatted content from crawled pages
         """
         try:
-            # Fix input type handling - ensure urls is always a list
-            if isinstance(urls, str):
-                urls = [urls]  # Convert single string to list
-            elif not isinstance(urls, (list, tuple)):
-                # Handle other iterables, but prevent string iteration
-                try:
-                    urls = list(urls)
-                except TypeError:
-                    urls = [str(urls)]  # Fallback for non-iterable types
+            urls = self._normalize_url_input(urls)
 
-            print(f"🔧 Processing {len(urls)} URL(s) for crawling with Jina Reader")
+            logger.info("🔧 Processing %d URL(s) for crawling with Jina Reader", len(urls))
 
             # Parse and validate URLs
-            url_list = []
-            for url in urls:
-                url = url.strip()
-                if url:
-                    validated_url = self._ensure_valid_url(url)
-                    if validated_url and self.is_allowed_domain(validated_url):
-                        url_list.append(validated_url)
+            url_list = [v for u in urls if (v := self._validate_url(u.strip()))]
 
             if not url_list:
                 return "❌ No valid URLs provided"
 
-            print(f"🔍 Reading {len(url_list)} selected URLs with Jina Reader API...")
-
-            # Handle async reading properly
-            try:
-                loop = asyncio.get_running_loop()
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(self._run_jina_reading, url_list)
-                    results = future.result()
-            except RuntimeError:
-                results = asyncio.run(self._jina_read_multiple_urls(url_list))
+            logger.info("🔍 Reading %d selected URLs with Jina Reader API...", len(url_list))
 
-            return self._format_jina_results(results)
+            # Works whether or not the caller is already inside an event loop; pages are
+            # formatted in the order they finish reading
+            return _collect_after_batch(
+                _run_in_background_loop(
+                    self._format_jina_stream(self._iter_jina_reads(url_list))
+                )
+            )
 
         except Exception as e:
             return f"❌ Error in crawl_selected_urls: {str(e)}"
 
-    def _run_jina_reading(self, urls):
-        """Helper method to run Jina reading in a new event loop."""
-        return asyncio.run(self._jina_read_multiple_urls(urls))
-
-    def _format_jina_results(self, results: List[Tuple[str, str]]) -> str:
-        """Format Jina Reader results for agent consumption."""
-        if not results:
-            return "❌ No results to display"
-
-        output = []
-        output.append("=== JINA READER CONTENT ===\n")
+    async def _format_jina_stream(
+        self, results: AsyncIterator[Tuple[str, str, bool]]
+    ) -> str:
+        """Format Jina Reader results as they arrive, so each page's content can be freed once written."""
+        buf = io.StringIO()
+        w = buf.write
+        w("=== JINA READER CONTENT ===\n\n")
 
-        # Add content from each URL with stats
+        url_count = 0
         total_content_length = 0
-        for url, content in results:
-            content_length = len(content)
-            total_content_length += content_length
-
-            output.append(f"URL: {url}")
-            output.append(f"Content Length: {content_length} characters")
+        async for url, content, _ in results:
+            url_count += 1
+            total_content_length += self._write_jina_entry(w, url, content)
 
-            # Show ALL content - no truncation limit
-            output.append(f"Content: {content}")
-            output.append("")  # Empty line for readability
-
-        # Add summary
-        output.append(f"=== READING SUMMARY ===")
-        output.append(f"Total URLs processed: {len(results)}")
-        output.append(f"Total content extracted: {total_content_length} characters")
+        if not url_count:
+            return "❌ No results to display"
 
-        return "\n".join(output)
+        self._write_jina_summary(w, url_count, total_content_length)
+        return buf.getvalue()
+
+    @staticmethod
+    def _write_jina_entry(w, url: str, content: str) -> int:
+        """Write one URL's section of the Jina Reader report and return its content length."""
+        content_length = len(content)
+        w("URL: ")
+        w(url)
+        w("\nContent Length: ")
+        w(str(content_length))
+
+        # Show ALL content - no truncation limit
+        w(" characters\nContent: ")
+        w(content)
+        w("\n\n")  # Empty line for readability
+        return content_length
+
+    @staticmethod
+    def _write_jina_summary(w, url_count: int, total_content_length: int) -> None:
+        """Write the summary that closes a Jina Reader report."""
+        w("=== READING SUMMARY ===\n")
+        w(f"Total URLs processed: {url_count}\n")
+        w(f"Total content extracted: {total_content_length} characters")
 
     def process_pdf_urls(self, urls) -> str:
         """
@@ -762,86 +1374,126 @@ class WebCrawlerTool(Toolkit):
             str: Formatted content from processed PDFs
         """
         try:
-            # Fix input type handling - ensure urls is always a list
-            if isinstance(urls, str):
-                urls = [urls]  # Convert single string to list
-            elif not isinstance(urls, (list, tuple)):
-                # Handle other iterables, but prevent string iteration
-                try:
-                    urls = list(urls)
-                except TypeError:
-                    urls = [str(urls)]  # Fallback for non-iterable types
-
-            print(f"📄 Processing {len(urls)} PDF URL(s) with Jina Reader")
-
-            # Parse and validate PDF URLs
-            url_list = []
-            for url in urls:
-                url = url.strip()
-                if url:
-                    validated_url = self._ensure_valid_url(url)
-                    if validated_url and self.is_allowed_domain(validated_url):
-                        url_list.append(validated_url)
-                        print(f"✅ Valid PDF URL: {validated_url}")
+            urls = self._normalize_url_input(urls)
+
+            # Parse and validate PDF URLs in one pass - duplicates are fetched once
+            url_list = list(
+                dict.fromkeys(
+                    v for u in urls if (v := self._validate_url(u.strip()))
+                )
+            )
+
+            logger.info("📄 Validated %d/%d PDF URLs", len(url_list), len(urls))
 
             if not url_list:
                 return "❌ No valid PDF URLs provided"
 
-            print(f"🔍 Processing {len(url_list)} PDF URLs with Jina Reader API...")
+            # Works whether or not the caller is already inside an event loop; PDFs are
+            # formatted in the order they finish reading
+            return _collect_after_batch(
+                _run_in_background_loop(
+                    self._format_pdf_stream(self._iter_pdf_reads(url_list))
+                )
+            )
 
-            # Handle async PDF processing properly
-            try:
-                loop = asyncio.get_running_loop()
-                import concurrent.futures
+        except Exception as e:
+            return f"❌ Error in process_pdf_urls: {str(e)}"
 
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(self._run_jina_reading, url_list)
-                    results = future.result()
-            except RuntimeError:
-                results = asyncio.run(self._jina_read_multiple_urls(url_list))
+    async def _iter_pdf_reads(self, urls: List[str]) -> AsyncIterator[Tuple[bool, int, str]]:
+        """
+        Read PDFs concurrently, yielding each PDF's formatted block as soon as it is read.
 
-            return self._format_pdf_jina_results(results)
+        Yields:
+            (ok, content_length, formatted_block) per PDF, in completion order
+        """
+        if not urls:
+            return
 
-        except Exception as e:
-            return f"❌ Error in process_pdf_urls: {str(e)}"
+        max_concurrent = min(len(urls), self.jina_concurrency)
 
-    def _format_pdf_jina_results(self, results: List[Tuple[str, str]]) -> str:
-        """Format PDF processing results from Jina Reader for agent consumption."""
-        if not results:
-            return "❌ No PDF results to display"
+        logger.info(
+            "🚀 Starting PDF processing of %d URLs with %d concurrent workers",
+            len(urls),
+            max_concurrent,
+        )
 
-        output = []
-        output.append("=== PDF PROCESSING RESULTS (Jina Reader) ===\n")
+        # Lowered on 429 / 503 so the batch backs off instead of hammering Jina
+        gate = AdmissionGate(max_concurrent)
 
-        # Add content from each PDF with stats
+        async def process_one(url: str) -> Tuple[bool, int, str]:
+            """Read and format a single PDF, turning any exception into a failed block."""
+            try:
+                async with gate:
+                    content, ok = await self._jina_fetch_with_timeout(
+                        url, self.pdf_timeout, session=session, gate=gate
+                    )
+            except Exception as e:
+                logger.warning("❌ Failed to process PDF %s: %s", url, e)
+                content, ok = f"Exception: {str(e)}", False
+            content_length = len(content) if ok else 0
+            return ok, content_length, self._format_pdf_block(url, content, ok)
+
+        async with self._jina_session(max_concurrent) as session:
+            async for result in _iter_with_workers(process_one, urls, max_concurrent):
+                yield result
+
+    async def _format_pdf_stream(self, results: AsyncIterator[Tuple[bool, int, str]]) -> str:
+        """Format PDF results as they arrive, so each PDF's content can be freed once written."""
+        buf = io.StringIO()
+        w = buf.write
+        w("=== PDF PROCESSING RESULTS (Jina Reader) ===\n\n")
+
+        pdf_count = 0
         total_content_length = 0
-        for url, content in results:
-            content_length = len(content)
+        successful_pdfs = 0
+        async for ok, content_length, block in results:
+            pdf_count += 1
             total_content_length += content_length
+            if ok:
+                successful_pdfs += 1
+            w(block)
 
-            output.append(f"PDF URL: {url}")
-            output.append(f"Content Length: {content_length} characters")
+        if not pdf_count:
+            return "❌ No PDF results to display"
 
-            # Show ALL content - no truncation limit
-            output.append("Extracted Content:")
-            output.append(f"{content}")
-            output.append("")  # Empty line for readability
+        w(self._format_pdf_summary(pdf_count, total_content_length, successful_pdfs))
+        return buf.getvalue()
+
+    def _format_pdf_block(self, url: str, content: str, ok: bool) -> str:
+        """Format the output block for a single PDF (a one-line status if it failed)."""
+        if not ok:
+            reason = content.splitlines()[0] if content else "unknown error"
+            return f"PDF URL: {url}\nStatus: FAILED ({reason})\n\n"
+
+        # Show ALL content - no truncation limit. One join sizes the block up front,
+        # so the (possibly large) content is copied once.
+        return "".join(
+            (
+                "PDF URL: ",
+                url,
+                "\nContent Length: ",
+                str(len(content)),
+                " characters\nExtracted Content:\n",
+                content,
+                "\n\n",  # Empty line for readability
+            )
+        )
 
-        # Add summary
-        output.append("=== PDF PROCESSING SUMMARY ===")
-        output.append(f"Total PDFs processed: {len(results)}")
-        output.append(f"Total content extracted: {total_content_length} characters")
+    @staticmethod
+    def _format_pdf_summary(
+        pdf_count: int, total_content_length: int, successful_pdfs: int
+    ) -> str:
+        """Format the summary that closes a PDF processing report."""
+        buf = io.StringIO()
+        w = buf.write
+        w("=== PDF PROCESSING SUMMARY ===\n")
+        w(f"Total PDFs processed: {pdf_count}\n")
+        w(f"Total content extracted: {total_content_length} characters\n")
 
-        # Count successful vs failed processing
-        successful_pdfs = sum(
-            1
-            for _, content in results
-            if not content.startswith(("Error:", "Exception:"))
-        )
-        failed_pdfs = len(results) - successful_pdfs
+        failed_pdfs = pdf_count - successful_pdfs
 
-        output.append(f"Successfully processed: {successful_pdfs} PDFs")
+        w(f"Successfully processed: {successful_pdfs} PDFs")
         if failed_pdfs > 0:
-            output.append(f"Failed to process: {failed_pdfs} PDFs")
+            w(f"\nFailed to process: {failed_pdfs} PDFs")
 
-        return "\n".join(output)
+        return buf.getvalue()